@@ -2,18 +2,28 @@
 This module initializes the configuration and validates the source directory for the RemakeEngine.
 """
 import builtins
+import contextlib
+import errno
+import io
 import json
 import shutil # Import shutil for file operations
+import stat
 from pathlib import Path
 
 import os
 import sys
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', '.')))
+import time
+from dataclasses import dataclass, field
+# Engine root (four levels above Scripts/); one string normalization instead of dirname/join/abspath
+_ROOT = os.path.normpath(__file__ + "/../../../../..")
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
 from Engine.Utils.printer import print, Colours
 
 
 # --- Constants for Directory Lists ---
-USRDIR_DIRS = [
+# frozenset: membership checks against the scanned directory names are O(1)
+REQUIRED_DIRS = frozenset({
     "ENVS",
     "FMV",
     "GRAPHICS",
@@ -22,17 +32,7 @@ USRDIR_DIRS = [
     "MISC",
     "SOUNDS",
     "SUBTITLE"
-]
-USRDIR_DIRS_ORIGINAL = [
-    "ENVS",
-    "FMV",
-    "GRAPHICS",
-    "GUIMENU",
-    "IRX",
-    "MISC",
-    "SOUNDS",
-    "SUBTITLE"
-]
+})
 
 # --- Status Codes for Clarity ---
 CREATED = "CREATED"
@@ -46,27 +46,501 @@ ERROR_INVALID_SOURCEPATH_DIR = "ERROR_INVALID_SOURCEPATH_DIR"
 USER_PROVIDED_PATH_INVALID = "USER_PROVIDED_PATH_INVALID"
 ERROR_FILE_OPERATION = "ERROR_FILE_OPERATION" # New status for copy/move errors
 
-# --- Helper Function: check_dirs_exist (Unchanged) ---
-def check_dirs_exist(base_path, required_dirs, list_name=""):
-    # (Keep the implementation of check_dirs_exist as it was)
-    if not os.path.isdir(base_path):
-        print(colour="RED", prefix="INIT", message=f"  Error: The base path '{base_path}' provided for checking subdirs is not a valid directory.")
+# --- Source Handling Prompt (%-formatted with Colours.YELLOW and the source/destination basenames) ---
+PROMPT_COPY = "  1) %s from '%s' to local '%s' (Recommended, Safe)"
+PROMPT_MOVE = "  2) %s from '%s' to local '%s' (Warning: Deletes original Files at Source location)"
+PROMPT_USE_ORIGINAL = "  3) %s '%s' directly (Warning: This Tool might modify/corrupt original files)"
+
+# --- Validation Cache ---
+# Sidecar file (next to the config) remembering the last path that passed validation and its directory mtime
+VALIDATION_CACHE_FILE = "validation.cache"
+
+# --- Copy Tuning ---
+COPY_CHUNK_SIZE = 1 << 20 # 1 MiB per copy_file_range/sendfile/read call
+PROGRESS_INTERVAL = 0.25 # Minimum seconds between progress line repaints
+ERASE_LINE = '\x1b[2K\r' # ANSI erase-line + carriage return; repaints without padding the line to full width
+
+_O_BINARY = getattr(os, "O_BINARY", 0) # Windows only, required for raw fd copies
+_O_CLOEXEC = getattr(os, "O_CLOEXEC", 0) # POSIX only
+
+# --- Buffered Logging ---
+class _Logger:
+    """
+    Collects INIT log lines for one phase (validation, final status report) and emits them with a single
+    stdout write + flush instead of one per line. Formatting stays in Engine.Utils.printer; its output is
+    only captured and batched. Callers must flush() at the end of each phase and before prompting for input.
+    """
+    def __init__(self):
+        self.buf = []
+
+    def log(self, colour, prefix, message):
+        """Queues one line; arguments match Engine.Utils.printer.print(colour=, prefix=, message=)."""
+        self.buf.append((colour, prefix, message))
+
+    def flush(self):
+        if not self.buf:
+            return
+        captured = io.StringIO()
+        with contextlib.redirect_stdout(captured):
+            for colour, prefix, message in self.buf:
+                print(colour=colour, prefix=prefix, message=message)
+        self.buf.clear()
+        sys.stdout.write(captured.getvalue())
+        sys.stdout.flush()
+
+_init_log = _Logger()
+
+# --- Helper Functions: Low-level file copy ---
+def _walk_tree(src, dst, follow_symlinks=True):
+    """
+    Yields (src_dir, dst_dir, file_entries, link_entries) for src and every subdirectory, parents before children.
+    An explicit os.scandir stack: directory/file decisions come from the DirEntry's cached d_type, file paths
+    from DirEntry.path, and each destination directory is derived once from its parent's, with no relpath/join per level.
+    Symlinks are followed as shutil.copytree(symlinks=False) did: linked directories are descended into and
+    linked files are copied by content. With follow_symlinks=False every symlink is instead returned in
+    link_entries, so it can be recreated as a link (as shutil.move does) without touching its target.
+    Dangling symlinks (when following) and special files raise instead of being skipped,
+    and scan errors propagate to the caller instead of silently skipping a directory.
+    """
+    stack = [(src, dst)]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        file_entries = []
+        link_entries = []
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                if not follow_symlinks and entry.is_symlink():
+                    link_entries.append(entry)
+                elif entry.is_dir():
+                    stack.append((entry.path, os.path.join(dst_dir, entry.name)))
+                elif entry.is_file():
+                    file_entries.append(entry)
+                elif entry.is_symlink():
+                    raise FileNotFoundError(errno.ENOENT, "Dangling symlink", entry.path)
+                else:
+                    raise shutil.SpecialFileError(f"'{entry.path}' is not a regular file or directory")
+        yield src_dir, dst_dir, file_entries, link_entries
+
+def _ensure_dir(path, created_dirs):
+    """
+    Creates directory path (if needed) and records it in created_dirs.
+    When the parent was created earlier in the same copy it is known to exist, so a single mkdir replaces
+    os.makedirs' parent stat + mkdir (+ stat on EEXIST) sequence.
+    """
+    if path in created_dirs:
+        return
+    if os.path.dirname(path) in created_dirs:
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            if not os.path.isdir(path):
+                raise
+    else:
+        os.makedirs(path, exist_ok=True)
+    created_dirs.add(path)
+
+def _copy_fd(src_fd, dst_fd):
+    """
+    Streams the remaining contents of src_fd into dst_fd.
+    Prefers in-kernel copies (copy_file_range, then sendfile) and falls back to a buffered read/write loop.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            while os.copy_file_range(src_fd, dst_fd, COPY_CHUNK_SIZE):
+                pass
+            return
+        except OSError:
+            pass # e.g. EXDEV/ENOSYS on older kernels; continue from the current offset below
+    if hasattr(os, "sendfile"):
+        offset = os.lseek(src_fd, 0, os.SEEK_CUR)
+        try:
+            while True:
+                sent = os.sendfile(dst_fd, src_fd, offset, COPY_CHUNK_SIZE)
+                if not sent:
+                    return
+                offset += sent
+        except OSError:
+            os.lseek(src_fd, offset, os.SEEK_SET) # e.g. macOS only supports sockets as out_fd
+    with open(src_fd, 'rb', closefd=False) as fsrc, open(dst_fd, 'wb', closefd=False) as fdst:
+        shutil.copyfileobj(fsrc, fdst, COPY_CHUNK_SIZE)
+
+def _copy_file(src, dst):
+    """
+    Copies file data plus permission bits and timestamps from src to dst (equivalent to shutil.copy2).
+    Returns the number of bytes copied.
+    """
+    src_fd = os.open(src, os.O_RDONLY | _O_BINARY | _O_CLOEXEC)
+    try:
+        st = os.fstat(src_fd)
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY | _O_CLOEXEC, st.st_mode & 0o777)
+        try:
+            _copy_fd(src_fd, dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.chmod(dst, st.st_mode & 0o7777)
+    return st.st_size
+
+# --- Helper Functions: copy_tree ---
+@dataclass
+class _CopyProgress:
+    """Running totals for one copy_tree call, passed explicitly to _copy_with_progress instead of captured by a closure."""
+    files: int = 0
+    bytes: int = 0
+    last_emit: float = field(default_factory=time.monotonic)
+    shown: bool = False
+
+def _copy_with_progress(src, dst, *, state):
+    """Copies one file and repaints the progress line at most once per PROGRESS_INTERVAL."""
+    state.bytes += _copy_file(src, dst)
+    state.files += 1
+    # Throttle repaints; stdout write+flush per file dominated small-file copies
+    now = time.monotonic()
+    if now - state.last_emit >= PROGRESS_INTERVAL:
+        sys.stdout.write(f"{ERASE_LINE}{state.files} files, {state.bytes / 1e6:.1f} MB copied")
+        sys.stdout.flush()
+        state.last_emit = now
+        state.shown = True
+
+def copy_tree(src, dst, unlink_source=False):
+    """
+    Copies the directory tree src into dst (merging into an existing dst) in a single traversal,
+    streaming a throttled "N files, X MB copied" progress line to stdout.
+
+    Args:
+        src (str): Directory to copy from.
+        dst (str): Directory to copy into.
+        unlink_source (bool): Delete each source file right after it is copied and remove the emptied
+            source directories at the end, so a cross-device move never holds two full copies on disk.
+            Symlinks are then moved as links rather than followed, and the whole tree is scanned before
+            anything is deleted, so an entry that cannot be moved fails while the source is still intact.
+
+    Returns:
+        tuple: (copied_files_count, copied_bytes)
+    """
+    state = _CopyProgress()
+    visited_dirs = []
+    created_dirs = set()
+    walk = _walk_tree(src, dst, follow_symlinks=not unlink_source)
+    if unlink_source:
+        walk = list(walk)
+    try:
+        for src_dir, dest_dir, file_entries, link_entries in walk:
+            visited_dirs.append(src_dir)
+            _ensure_dir(dest_dir, created_dirs)
+            for entry in file_entries:
+                _copy_with_progress(entry.path, os.path.join(dest_dir, entry.name), state=state)
+                if unlink_source:
+                    os.unlink(entry.path)
+            for entry in link_entries:
+                os.symlink(os.readlink(entry.path), os.path.join(dest_dir, entry.name), target_is_directory=entry.is_dir())
+                if unlink_source:
+                    os.unlink(entry.path)
+        if unlink_source:
+            for src_dir in reversed(visited_dirs): # Children were visited after their parents
+                os.rmdir(src_dir)
+    finally:
+        # Ensure the next message starts on a clean line
+        if state.shown:
+            sys.stdout.write(ERASE_LINE)
+            sys.stdout.flush()
+    return state.files, state.bytes
+
+# --- Helper Function: move_directory ---
+def move_directory(src, dst):
+    """
+    Moves the directory src to dst, creating dst's parent if needed.
+    On the same device this is a single atomic os.rename, which also replaces a racy exists-then-move check.
+    Across devices the files are copied with copy_tree and each source file is unlinked once copied;
+    symlinks are recreated as links, and if the tree cannot be moved before anything is transferred
+    the freshly created dst is removed again. If src is itself a symlink, the link is moved and its
+    target is left untouched, as with shutil.move.
+
+    Raises:
+        FileExistsError: If dst already exists.
+    """
+    dst_parent = os.path.dirname(dst)
+    os.makedirs(dst_parent, exist_ok=True)
+    src_st = os.lstat(src)
+    if src_st.st_dev == os.stat(dst_parent).st_dev:
+        try:
+            os.rename(src, dst)
+            return
+        except OSError as e:
+            if e.errno == errno.ENOTEMPTY: # POSIX reports an existing non-empty dst this way
+                raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dst) from e
+            if e.errno != errno.EXDEV: # Same device but different mount points still needs the copy path
+                raise
+    if stat.S_ISLNK(src_st.st_mode):
+        os.symlink(os.readlink(src), dst, target_is_directory=True) # Raises FileExistsError if dst already exists
+        os.unlink(src)
+        return
+    os.mkdir(dst) # Raises FileExistsError if dst already exists
+    try:
+        copy_tree(src, dst, unlink_source=True)
+    except BaseException:
+        try:
+            os.rmdir(dst) # Only succeeds if nothing was transferred yet
+        except OSError:
+            pass
+        raise
+
+# --- Helper Function: write_config ---
+def write_config(config_file_path, config_data):
+    """
+    Serializes config_data to UTF-8 bytes once and writes it atomically to config_file_path.
+    The payload goes to a sibling '.tmp' file in a single write, is fsync'ed, then swapped in with os.replace,
+    so an interrupted write never leaves a torn or empty config behind.
+    """
+    payload = json.dumps(config_data, indent=4, ensure_ascii=False).encode('utf-8')
+    tmp_path = config_file_path + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, config_file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# --- Helper Functions: validation cache ---
+def dir_mtime_ns(path):
+    """Returns the st_mtime_ns of path, or None if it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def is_validation_cached(cache_file_path, path):
+    """
+    True if path passed validation on a previous run and its mtime is unchanged since.
+    Adding, removing or renaming a required subdirectory updates the parent's mtime, which invalidates the entry.
+    """
+    try:
+        cache = json.loads(Path(cache_file_path).read_bytes())
+        return (cache.get("result") == EXISTS_VALID
+                and cache.get("path") == path
+                and cache.get("mtime_ns") == os.stat(path).st_mtime_ns)
+    except (OSError, ValueError, AttributeError):
         return False
-    missing = []
-    print(colour="CYAN", prefix="INIT", message=f"  Checking against list '{list_name}':") if list_name else print(colour="CYAN", prefix="INIT", message="  Checking against list:")
-    for dir_name in required_dirs:
-        full_path = os.path.join(base_path, dir_name)
-        if not os.path.isdir(full_path):
-            missing.append(dir_name)
+
+def store_validation_cache(cache_file_path, path, mtime_ns):
+    """Records a successful validation of path. Best-effort: failures only cost a re-validation next run."""
+    if mtime_ns is None:
+        return
+    try:
+        write_config(cache_file_path, {"path": path, "mtime_ns": mtime_ns, "result": EXISTS_VALID})
+    except OSError:
+        pass
+
+# --- Helper Functions: find_missing_dirs ---
+def find_missing_dirs(base_path, required_dirs=REQUIRED_DIRS, list_name="REQUIRED_DIRS"):
+    """
+    Returns the names in required_dirs that are not subdirectories of base_path.
+    One scandir pass (DirEntry.is_dir() uses the cached d_type) and a set difference; no per-name join or stat.
+    Messages are buffered in _init_log; the caller flushes them.
+
+    Returns:
+        frozenset or None: Required names not found (empty if all exist), or None if base_path could not be read.
+    """
+    try:
+        with os.scandir(base_path) as it:
+            present = {entry.name for entry in it if entry.is_dir()}
+    except OSError:
+        _init_log.log(colour="RED", prefix="INIT", message=f"  Error: The base path '{base_path}' provided for checking subdirs is not a valid directory.")
+        return None
+    _init_log.log(colour="CYAN", prefix="INIT", message=f"  Checking against list '{list_name}':" if list_name else "  Checking against list:")
+    missing = frozenset(required_dirs) - present
     if not missing:
-        print(colour="DARK_GREEN", prefix="INIT", message=f"    Success: All {len(required_dirs)} directories from this list found in '{base_path}'.")
-        return True
+        _init_log.log(colour="DARK_GREEN", prefix="INIT", message=f"    Success: All {len(required_dirs)} directories from this list found in '{base_path}'.")
+    return missing
+
+def describe_missing_dirs(missing, required_dirs=REQUIRED_DIRS):
+    """Formats the absence report from find_missing_dirs' result against the same required_dirs, so failures never need a second scan."""
+    if missing is None:
+        return "  Missing subdirectories: (directory could not be read)"
+    return f"  Missing {len(missing)} of {len(required_dirs)} subdirectories: {', '.join(sorted(missing))}"
+
+# --- Helper Function: resolve_validation_path ---
+def resolve_validation_path(effective_source_path):
+    """
+    Picks the directory to validate: 'USRDIR' inside effective_source_path if present, else the path itself.
+    The USRDIR probe is a single os.stat whose result also supplies the mtime for the validation cache.
+
+    Returns:
+        tuple: (path_to_validate, mtime_ns)
+                path_to_validate (str): Directory whose subdirectories should be checked.
+                mtime_ns (int or None): Its st_mtime_ns, taken before the scan so a concurrent change invalidates the cache.
+    """
+    potential_usrdir_path = os.path.join(effective_source_path, "USRDIR")
+    try:
+        st = os.stat(potential_usrdir_path)
+        is_usrdir = stat.S_ISDIR(st.st_mode)
+    except OSError:
+        is_usrdir = False
+    if is_usrdir:
+        _init_log.log(colour="BLUE", prefix="INIT", message=f"  Info: Found 'USRDIR' subdirectory within effective path.")
+        _init_log.log(colour="BLUE", prefix="INIT", message=f"  Info: Using '{potential_usrdir_path}' for subdirectory validation due to found USRDIR.")
+        return potential_usrdir_path, st.st_mtime_ns
+    _init_log.log(colour="BLUE", prefix="INIT", message=f"  Info: 'USRDIR' subdirectory not found within effective path '{effective_source_path}'.")
+    _init_log.log(colour="BLUE", prefix="INIT", message=f"  Info: Will check for required subdirectories directly inside: '{effective_source_path}'")
+    return effective_source_path, dir_mtime_ns(effective_source_path)
+
+# --- Helper Functions: config load/save ---
+def _load_config(config_file_path):
+    """Reads and parses the JSON config; decodes the whole file in one shot instead of streaming a text-mode reader."""
+    return json.loads(Path(config_file_path).read_bytes())
+
+def _get_source_path(config_data):
+    """Returns RemakeEngine.Directories.TSGPS2SourcePath, or None if the config does not have that shape."""
+    try:
+        return config_data.get("RemakeEngine", {}).get("Directories", {}).get("TSGPS2SourcePath")
+    except AttributeError:
+        return None
+
+def _set_source_path(config_data, path):
+    """Stores path as RemakeEngine.Directories.TSGPS2SourcePath. Raises AttributeError or TypeError if the config has the wrong shape."""
+    config_data.setdefault("RemakeEngine", {}).setdefault("Directories", {})["TSGPS2SourcePath"] = path
+
+def _save_config(config_file_path, config_data, filename, path):
+    """Stores path in config_data and writes it, reporting (but not raising) failures; the run proceeds with path."""
+    print(colour="YELLOW", prefix="INIT", message=f"  Attempting to update '{filename}' with Source Path '{path}'...")
+    try:
+        _set_source_path(config_data, path)
+        write_config(config_file_path, config_data)
+        print(colour="GREEN", prefix="INIT", message=f"  Success: Config file '{filename}' updated.")
+    except Exception as e:
+        print(colour="RED", prefix="INIT", message=f"  Error updating config file '{filename}': {e}")
+        print(colour="YELLOW", prefix="INIT", message="  Warning: Proceeding with the provided path, but config file was not saved.")
+
+# --- Helper Functions: source path prompt and handling ---
+def _prompt_source_path():
+    """Asks for a source directory until the user enters one that exists."""
+    while True:
+        print(colour="CYAN", prefix="INIT", message="Please enter the full path to the source directory:")
+        user_input_path = input("> ").strip()
+        if not user_input_path:
+            print(colour="YELLOW", prefix="INIT", message="Path cannot be empty. Please try again.")
+            continue
+        if os.path.isdir(user_input_path):
+            print(colour="DARK_GREEN", prefix="INIT", message=f"  Path '{user_input_path}' is a valid directory.")
+            return user_input_path
+        print(colour="RED", prefix="INIT", message=f"  Error: The path '{user_input_path}' is not a valid directory. Please try again.")
+
+def _copy_source(path_from_config, local_data_path):
+    """Option 1: copies the source into the local data path. Returns True on success."""
+    print(colour="GREEN", prefix="INIT", message=f"\nPreparing to copy files from '{path_from_config}' to '{local_data_path}'...")
+    try:
+        copied_files_count, copied_bytes = copy_tree(path_from_config, local_data_path)
+    except (shutil.Error, OSError, Exception) as e:
+        print(colour="RED", prefix="INIT", message=f"\nError during copy operation: {e}") # Add newline for clarity
+        print(colour="RED", prefix="INIT", message="Cannot proceed with file operations.")
+        return False
+    if copied_files_count == 0:
+        print(colour="GREEN", prefix="INIT", message="Source directory is empty or contains no files. Nothing to copy.")
     else:
-        # print(colour="YELLOW", prefix="INIT", message=f"    Info: Missing {len(missing)} subdirectories in '{base_path}': {', '.join(missing)}")
+        print(colour="GREEN", prefix="INIT", message=f"Copy successful. {copied_files_count} files ({copied_bytes / 1e6:.1f} MB) copied.")
+    return True
+
+def _move_source(path_from_config, local_data_path):
+    """Option 2: moves the source to the local data path. Returns True on success, False on error, None if the destination exists."""
+    print(colour="RED", prefix="INIT", message=f"\nAttempting to move files from '{path_from_config}' to '{local_data_path}'...")
+    try:
+        move_directory(path_from_config, local_data_path)
+    except FileExistsError:
+        print(colour="RED", prefix="INIT", message=f"Error: Destination path '{local_data_path}' already exists. Cannot move.")
+        print(colour="YELLOW", prefix="INIT", message="Please remove the existing directory or choose 'Copy' (option 1) or 'Use original' (option 3).")
+        return None
+    except (shutil.Error, OSError, Exception) as e:
+        print(colour="RED", prefix="INIT", message=f"Error during move operation: {e}")
+        print(colour="RED", prefix="INIT", message="Cannot proceed with file operations.")
+        # Note: If move fails partially, source might be corrupted.
         return False
+    print(colour="GREEN", prefix="INIT", message="Move successful.")
+    return True
+
+def _choose_source_handling(path_from_config, local_data_path):
+    """
+    Asks whether to copy, move or directly use path_from_config and performs the chosen operation.
+
+    Returns:
+        tuple: (effective_source_path or None, choice)
+                effective_source_path (str or None): Path to validate next, or None if a copy/move failed.
+                choice (str): The option the user picked ('1', '2' or '3').
+    """
+    print(colour="YELLOW", prefix="INIT", message="\nChoose how to use the source files:")
+    src_base = os.path.basename(path_from_config)
+    dst_base = os.path.basename(local_data_path)
+    print(colour="CYAN", prefix="Copy files", message=PROMPT_COPY % (Colours.YELLOW, src_base, dst_base))
+    print(colour="CYAN", prefix="Move files", message=PROMPT_MOVE % (Colours.YELLOW, src_base, dst_base))
+    print(colour="CYAN", prefix="Use original path", message=PROMPT_USE_ORIGINAL % (Colours.YELLOW, src_base))
+
+    while True:
+        choice = input("Enter your choice (1, 2, or 3): ").strip()
+        if choice == '1':
+            return (local_data_path if _copy_source(path_from_config, local_data_path) else None), choice
+        elif choice == '2':
+            moved = _move_source(path_from_config, local_data_path)
+            if moved is None:
+                continue # Loop again to ask for choice
+            return (local_data_path if moved else None), choice
+        elif choice == '3':
+            print(colour="CYAN", prefix="INIT", message=f"\nUsing original path '{path_from_config}' directly.")
+            print(colour="YELLOW", prefix="INIT", message="Warning: Ensure you have a backup, as subsequent operations might modify these files.")
+            return path_from_config, choice
+        else:
+            print(colour="YELLOW", prefix="INIT", message="Invalid choice. Please enter 1, 2, or 3.")
+
+# --- Helper Function: validate_subdirs ---
+def _validate_subdirs(source_path):
+    """
+    Resolves USRDIR within source_path and checks the required subdirectories.
+    The whole phase is logged through _init_log and flushed before returning.
+
+    Returns:
+        tuple: (all_found, missing, path_to_validate, mtime_ns) - see find_missing_dirs and resolve_validation_path.
+    """
+    path_to_validate, mtime_ns = resolve_validation_path(source_path)
+    _init_log.log(colour="CYAN", prefix="INIT", message=f"  Validating subdirectories in '{path_to_validate}'...")
+    missing = find_missing_dirs(path_to_validate)
+    _init_log.flush()
+    return missing == frozenset(), missing, path_to_validate, mtime_ns
+
+def _report_validation_failure(path_to_validate, effective_source_path, path_from_config, choice, missing_dirs):
+    """Logs the detailed report for a source path that failed validation as one _init_log phase."""
+    _init_log.log(colour="RED", prefix="INIT", message=f"\nError: Validation failed. Could not find all required subdirectories within '{path_to_validate}'.")
+    _init_log.log(colour="GRAY", prefix="INIT", message=f"  Checked within path: '{path_to_validate}'.")
+    if path_to_validate != effective_source_path:
+        _init_log.log(colour="GRAY", prefix="INIT", message=f"  (This path was checked because 'USRDIR' was found inside '{effective_source_path}')")
+    elif choice in ('1', '2'):
+        _init_log.log(colour="GRAY", prefix="INIT", message=f"  (This path resulted from a '{'Copy' if choice == '1' else 'Move'} operation' based on original '{path_from_config}')")
+
+    _init_log.log(colour="GRAY", prefix="INIT", message=f"  Expected all subdirs from list 'REQUIRED_DIRS': {', '.join(sorted(REQUIRED_DIRS))}.")
+    _init_log.log(colour="GRAY", prefix="INIT", message=describe_missing_dirs(missing_dirs))
+    _init_log.log(colour="RED", prefix="INIT", message=f"  Action Required: Verify the contents of '{path_to_validate}'.")
+    _init_log.flush()
+
+def _config_paths(filename):
+    """
+    Resolves the paths check_or_create_config works with, so a caller checking the same config repeatedly computes them once.
+
+    Returns:
+        tuple: (config_file_path, project_base_dir, local_data_path, cache_file_path)
+    """
+    config_file_path = os.path.abspath(filename)
+    project_base_dir = os.path.dirname(config_file_path)
+    local_data_path = os.path.join(project_base_dir, "Source", "GameFiles", "SimpGamePS2")
+    cache_file_path = os.path.join(project_base_dir, VALIDATION_CACHE_FILE)
+    return config_file_path, project_base_dir, local_data_path, cache_file_path
 
 # --- Modified check_or_create_config Function ---
-def check_or_create_config(filename):
+def check_or_create_config(filename, paths=None):
     """
     Checks/creates JSON config, validates SourcePath (prompting if needed).
     Asks user how to handle the validated source path (copy, move, use directly).
@@ -76,15 +550,14 @@ def check_or_create_config(filename):
 
     Args:
         filename (str): The name of the configuration file (e.g., "project.json").
+        paths (tuple, optional): Precomputed _config_paths(filename); resolved here if omitted.
 
     Returns:
         tuple: (status_code, path_value or None)
                 status_code (str): Outcome status.
                 path_value (str or None): Effective path used/validated, or None on errors.
     """
-    config_file_path = os.path.abspath(filename)
-    project_base_dir = os.path.dirname(config_file_path)
-    local_data_path = os.path.join(project_base_dir, "Source\\GameFiles\\SimpGamePS2")
+    config_file_path, project_base_dir, local_data_path, cache_file_path = paths or _config_paths(filename)
 
     default_data = {
         "RemakeEngine": {
@@ -95,336 +568,145 @@ def check_or_create_config(filename):
     }
 
     # --- Check 1: File Existence ---
-    if not os.path.exists(config_file_path):
+    # Only existence matters here; any other stat failure (permissions, a non-directory parent) is reported, not raised
+    try:
+        os.stat(config_file_path)
+    except FileNotFoundError:
         print(colour="YELLOW", prefix="INIT", message=f"File '{config_file_path}' not found. Creating it...")
         try:
-            with open(config_file_path, 'w', encoding='utf-8') as f:
-                json.dump(default_data, f, indent=4, ensure_ascii=False)
+            write_config(config_file_path, default_data)
             print(colour="GREEN", prefix="INIT", message=f"File '{config_file_path}' created successfully.")
-            #print(colour="RED, "  Action Required: The 'SourcePath' is empty. Run again to provide it.")
             return CREATED, None
         except Exception as e:
             print(colour="RED", prefix="INIT", message=f"Error creating file '{config_file_path}': {e}")
             return ERROR_CREATE, None
+    except OSError as e:
+        print(colour="RED", prefix="INIT", message=f"Error accessing '{config_file_path}': {e}")
+        return ERROR_READ, None
 
     # --- File Exists: Load and Validate ---
-    else:
-        print(colour="BLUE", prefix="INIT", message=f"File '{config_file_path}' exists. Verifying content...")
-        config_data = None
-        try:
-            with open(config_file_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-        except Exception as e:
-            print(colour="RED", prefix="INIT", message=f"Error reading or parsing '{config_file_path}': {e}")
-            return ERROR_READ, None
-
-        # --- Check 2: SourcePath key existence and validity ---
-        path_from_config = None # This will hold the path confirmed to be a directory
-        source_path_valid_in_file = False
-        try:
-            path_from_config = config_data.get("RemakeEngine", {}).get("Directories", {}).get("TSGPS2SourcePath")
-            if path_from_config and isinstance(path_from_config, str) and path_from_config.strip():
-                if os.path.isdir(path_from_config):
-                    effective_source_path = path_from_config
-
-                    potential_usrdir_path = os.path.join(effective_source_path, "USRDIR")
-                    path_to_validate = effective_source_path # Start with the effective path
-
-                    if os.path.isdir(potential_usrdir_path):
-                        print(colour="BLUE", prefix="INIT", message=f"  Info: Found 'USRDIR' subdirectory within effective path.")
-                        print(colour="BLUE", prefix="INIT", message=f"  Info: Will check for required subdirectories inside: '{potential_usrdir_path}'")
-                        path_to_validate = potential_usrdir_path # Update path for subdir check
-
-                        print(colour="BLUE", prefix="INIT", message=f"  Info: Using '{path_to_validate}' for subdirectory validation due to found USRDIR.")
-
-                    print(colour="CYAN", prefix="INIT", message=f"  Found SourcePath in config: '{path_from_config}'")
-                    print(colour="CYAN", prefix="INIT", message=f"  Validating subdirectories in '{path_to_validate}'...")
-                    found_original = check_dirs_exist(path_to_validate, USRDIR_DIRS_ORIGINAL, "USRDIR_DIRS_ORIGINAL")
-
-                    found_usrdir = False
-                    if not found_original:
-                        print(colour="YELLOW", prefix="INIT", message=f"  Info: Did not find all directories from the 'ORIGINAL' list. Checking second list ('USRDIR_DIRS')...")
-                        found_usrdir = check_dirs_exist(path_to_validate, USRDIR_DIRS, "USRDIR_DIRS")
-
-                    # Final validation result
-                    if found_usrdir or found_original:
-                        source_path_valid_in_file = True
-                    else:
-                        print(colour="RED", prefix="INIT", message=f"  Error: Validation failed. Could not find all required subdirectories from *either* list within '{path_to_validate}'.")
-
-                else:
-                    print(colour="YELLOW", prefix="INIT", message=f"  Warning: Configured SourcePath '{path_from_config}' is not currently a valid directory.")
-        except AttributeError:
-            pass
-
-        # --- Interactive Prompt if SourcePath is Invalid/Missing ---
-        if not source_path_valid_in_file:
-            print(colour="YELLOW", prefix="INIT", message=f"Warning: 'RemakeEngine.Directories.SourcePath' in '{filename}' is missing, empty, or invalid.")
-            while True:
-                print(colour="CYAN", prefix="INIT", message="Please enter the full path to the source directory:")
-                user_input_path = input("> ").strip()
-                if not user_input_path:
-                    print(colour="YELLOW", prefix="INIT", message="Path cannot be empty. Please try again.")
-                    continue
-                if os.path.isdir(user_input_path):
-                    print(colour="DARK_GREEN", prefix="INIT", message=f"  Path '{user_input_path}' is a valid directory.")
-                    path_from_config = user_input_path
-                    print(colour="YELLOW", prefix="INIT", message=f"  Attempting to update '{filename}' with user input path...")
-                    try:
-                        if "RemakeEngine" not in config_data: config_data["RemakeEngine"] = {}
-                        if "Directories" not in config_data["RemakeEngine"]: config_data["RemakeEngine"]["Directories"] = {}
-                        config_data["RemakeEngine"]["Directories"]["MainTSGPS2SourcePath"] = path_from_config
-                        with open(config_file_path, 'w', encoding='utf-8') as f:
-                            json.dump(config_data, f, indent=4, ensure_ascii=False)
-                        print(colour="GREEN", prefix="INIT", message=f"  Success: Config file '{filename}' updated.")
-                    except Exception as e:
-                        print(colour="RED", prefix="INIT", message=f"  Error updating config file '{filename}': {e}")
-                        print(colour="YELLOW", prefix="INIT", message="Warning: Proceeding with the provided path, but config file was not saved.")
-                    break # Exit loop after getting valid path
-                else:
-                    print(colour="RED", prefix="INIT", message=f"  Error: The path '{user_input_path}' is not a valid directory. Please try again.")
-            # Check if loop somehow exited without valid path (shouldn't happen)
-            if not path_from_config:
-                print(colour="RED", prefix="INIT", message="Could not obtain a valid SourcePath. Exiting.")
-                return USER_PROVIDED_PATH_INVALID, None
-
-        # --- Check 3: User choice for handling the source path ---
-        print(colour="MAGENTA", prefix="INIT", message="\n--- Source Path Handling ---")
-        print(colour="CYAN", prefix="INIT", message=f"Validated source path: '{path_from_config}'")
-        print(colour="CYAN", prefix="INIT", message=f"Local project data path would be: '{local_data_path}'")
-
-        effective_source_path = local_data_path
-
-        if not os.path.exists(local_data_path):
-            print(colour="YELLOW", prefix="INIT", message="\nChoose how to use the source files:")
-            print(colour="CYAN", prefix="Copy files", message=f"  1) {Colours.YELLOW} from '{os.path.basename(path_from_config)}' to local '{os.path.basename(local_data_path)}' (Recommended, Safe)")
-            print(colour="CYAN", prefix="Move files", message=f"  2) {Colours.YELLOW} from '{os.path.basename(path_from_config)}' to local '{os.path.basename(local_data_path)}' (Warning: Deletes original Files at Source location)")
-            print(colour="CYAN", prefix="Use original path", message=f"  3) {Colours.YELLOW} '{os.path.basename(path_from_config)}' directly (Warning: This Tool might modify/corrupt original files)")
-
-            while True:
-                choice = input("Enter your choice (1, 2, or 3): ").strip()
-
-                # --- Option 1: Copy with Progress ---
-                if choice == '1':
-                    # --- Start: Enhanced copy logic with progress ---
-                    print(colour="GREEN", prefix="INIT", message=f"\nPreparing to copy files from '{path_from_config}' to '{local_data_path}'...")
-
-                    # 1. Pre-calculate total number of files for progress reporting
-                    try:
-                        total_files = 0
-                        print(colour="CYAN", message="Calculating total number of files...")
-                        for _, _, files in os.walk(path_from_config):
-                            total_files += len(files)
-                        print(colour="CYAN", prefix="INIT", message=f"Found {total_files} files to copy.")
-                        if total_files == 0:
-                            print(colour="GREEN", prefix="INIT", message="Source directory is empty or contains no files. Nothing to copy.")
-                            effective_source_path = local_data_path # Set path even if empty
-                            # Ensure destination exists if source was empty but valid
-                            os.makedirs(local_data_path, exist_ok=True)
-                            break # Exit the loop successfully
-
-                    except OSError as e:
-                        print(colour="RED", prefix="INIT", message=f"Error accessing source path '{path_from_config}' to count files: {e}")
-                        print(colour="RED", prefix="INIT", message="Cannot proceed with file operations.")
-                        # Consider if this should be a critical error or allow retrying
-                        # return ERROR_FILE_OPERATION, None # Option: Critical error
-                        continue # Option: Go back to the start of the while loop to re-select choice
-
-                    # --- Variables for progress tracking ---
-                    copied_files_count = 0
-                    LINE_CLEAR = '\r' + ' ' * 80 + '\r' # Predefine line clearing string
-
-                    # 2. Define the custom copy function with progress update
-                    def copy_with_progress(src, dst, *, follow_symlinks=True):
-                        nonlocal copied_files_count # Use nonlocal to modify the outer scope variable
-                        # Perform the actual copy (use copy2 to preserve metadata)
-                        shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
-                        copied_files_count += 1
-                        # Display progress - use carriage return '\r' to overwrite the line
-                        progress = (copied_files_count / total_files) * 100
-                        # Use sys.stdout.write for better control with \r
-                        # Pad the output string to ensure it overwrites previous longer lines
-                        progress_text = f"\rCopying... {copied_files_count}/{total_files} files ({progress:.1f}%) copied. ".ljust(80)
-                        sys.stdout.write(progress_text)
-                        sys.stdout.flush() # Ensure the output is displayed immediately
-
-                    # --- Perform the copy operation ---
-                    # print(colour="GREEN + f"Attempting to copy files from '{path_from_config}' to '{local_data_path}'...") # Already announced preparation
-                    try:
-                        # 3. Use copytree with the custom copy_function
-                        shutil.copytree(path_from_config,
-                                        local_data_path,
-                                        dirs_exist_ok=True,  # Requires Python 3.8+
-                                        copy_function=copy_with_progress) # Pass the custom function
-
-                        # Ensure the final message overwrites the progress line completely
-                        sys.stdout.write(LINE_CLEAR) # Clear the line
-                        sys.stdout.flush()
-                        print(colour="GREEN", prefix="INIT", message="Copy successful.")
-                        effective_source_path = local_data_path
-                        break # Exit the loop on success
-
-                    except (shutil.Error, OSError, Exception) as e:
-                        # Ensure the final message overwrites the progress line completely
-                        sys.stdout.write(LINE_CLEAR) # Clear the line
-                        sys.stdout.flush()
-                        print(colour="RED", prefix="INIT", message=f"\nError during copy operation: {e}") # Add newline for clarity
-                        print(colour="RED", prefix="INIT", message="Cannot proceed with file operations.")
-                        return ERROR_FILE_OPERATION, None # Critical error, stop
-                    # --- End: Enhanced copy logic ---
-
-                elif choice == '2':
-                    print(colour="RED", prefix="INIT", message=f"\nAttempting to move files from '{path_from_config}' to '{local_data_path}'...")
-                    if os.path.exists(local_data_path):
-                        print(colour="RED", prefix="INIT", message=f"Error: Destination path '{local_data_path}' already exists. Cannot move.")
-                        print(colour="YELLOW", prefix="INIT", message="Please remove the existing directory or choose 'Copy' (option 1) or 'Use original' (option 3).")
-                        # Loop again to ask for choice
-                        continue
-                        # Alternative: Ask user to confirm overwrite (more complex)
-                        # confirmed = input(f"Warning: '{local_data_path}' exists. Overwrite? (yes/no): ").lower()
-                        # if confirmed == 'yes':
-                        #     try: shutil.rmtree(local_data_path) except Exception as e: print(colour="CYAN", prefix="INIT", message=f"Error removing existing dir: {e}"); return ERROR_FILE_OPERATION, None
-                        # else: continue # Go back to choice prompt
-                    try:
-                        shutil.move(path_from_config, local_data_path)
-                        print(colour="GREEN", prefix="INIT", message="Move successful.")
-                        effective_source_path = local_data_path
-                        break
-                    except (shutil.Error, OSError, Exception) as e:
-                        print(colour="RED", prefix="INIT", message=f"Error during move operation: {e}")
-                        print(colour="RED", prefix="INIT", message="Cannot proceed with file operations.")
-                        # Note: If move fails partially, source might be corrupted.
-                        return ERROR_FILE_OPERATION, None # Critical error, stop
-
-                elif choice == '3':
-                    print(colour="CYAN", prefix="INIT", message=f"\nUsing original path '{path_from_config}' directly.")
-                    print(colour="YELLOW", prefix="INIT", message="Warning: Ensure you have a backup, as subsequent operations might modify these files.")
-                    effective_source_path = path_from_config
-                    break
-
-                else:
-                    print(colour="YELLOW", prefix="INIT", message="Invalid choice. Please enter 1, 2, or 3.")
-
-        print(colour="YELLOW", prefix="INIT", message=f"  Attempting to update '{filename}' with local Source Path...")
-        try:
-            if "RemakeEngine" not in config_data:
-                config_data["RemakeEngine"] = {}
-            if "Directories" not in config_data["RemakeEngine"]:
-                config_data["RemakeEngine"]["Directories"] = {}
-            config_data["RemakeEngine"]["Directories"]["TSGPS2SourcePath"] = effective_source_path
-            with open(config_file_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=4, ensure_ascii=False)
-            print(colour="GREEN", prefix="INIT", message=f"  Success: Config file '{filename}' updated.")
-        except Exception as e:
-            print(colour="RED", prefix="INIT", message=f"  Error updating config file '{filename}': {e}")
-            print(colour="YELLOW", prefix="INIT", message="  Warning: Proceeding with the provided path, but config file was not saved.")
-
-        # --- Proceed with the 'effective_source_path' ---
-        print(colour="BLUE", prefix="INIT", message=f"\nUsing effective source path for validation: '{effective_source_path}'")
-
-        # --- Check 4: USRDIR subdirectory check & potential config update ---
-        # This logic now runs on the *effective* path (original, copied, or moved)
-        potential_usrdir_path = Path(effective_source_path) / "USRDIR"
-        path_to_validate = effective_source_path # Start with the effective path
-        config_updated_for_usrdir = False
-
-        if potential_usrdir_path.is_dir():
-            print(colour="BLUE", prefix="INIT", message=f"  Info: Found 'USRDIR' subdirectory within effective path.")
-            print(colour="BLUE", prefix="INIT", message=f"  Info: Will check for required subdirectories inside: '{potential_usrdir_path}'")
-            path_to_validate = potential_usrdir_path # Update path for subdir check
-
-            print(colour="BLUE", prefix="INIT", message=f"  Info: Using '{path_to_validate}' for subdirectory validation due to found USRDIR.")
-
-        else:
-            print(colour="BLUE", prefix="INIT", message=f"  Info: 'USRDIR' subdirectory not found within effective path '{effective_source_path}'.")
-            print(colour="BLUE", prefix="INIT", message=f"  Info: Will check for required subdirectories directly inside: '{effective_source_path}'")
-            # path_to_validate remains effective_source_path
-
-        # --- Check 5: Subdirectory validation using the 'path_to_validate' ---
-        print(colour="CYAN", prefix="INIT", message=f"  Starting subdirectory validation using path: '{path_to_validate}'...")
-        found_original = check_dirs_exist(path_to_validate, USRDIR_DIRS_ORIGINAL, "USRDIR_DIRS_ORIGINAL")
-
-        found_usrdir = False
-        if not found_original:
-            print(colour="BLUE", prefix="INIT", message=f"  Info: Did not find all directories from the 'ORIGINAL' list. Checking second list ('USRDIR_DIRS')...")
-            found_usrdir = check_dirs_exist(path_to_validate, USRDIR_DIRS, "USRDIR_DIRS")
-
-        # Final validation result
-        if found_usrdir or found_original:
-            list_name = "USRDIR_DIRS" if found_usrdir else "USRDIR_DIRS_ORIGINAL"
-            print(colour="GREEN", prefix="INIT", message=f"\nSuccess: Validation passed. All required subdirectories from list '{list_name}' found within '{path_to_validate}'.")
-
-            print(colour="YELLOW", prefix="INIT", message=f"  Attempting to update '{filename}' with Valid Source Path...")
-            try:
-                if "RemakeEngine" not in config_data:
-                    config_data["RemakeEngine"] = {}
-                if "Directories" not in config_data["RemakeEngine"]:
-                    config_data["RemakeEngine"]["Directories"] = {}
-                config_data["RemakeEngine"]["Directories"]["TSGPS2SourcePath"] = path_to_validate
-                with open(config_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(config_data, f, indent=4, ensure_ascii=False)
-                print(colour="GREEN", prefix="INIT", message=f"  Success: Config file '{filename}' updated.")
-            except Exception as e:
-                print(colour="RED", prefix="INIT", message=f"  Error updating config file '{filename}': {e}")
-                print(colour="YELLOW", prefix="INIT", message="  Warning: Proceeding with the provided path, but config file was not saved.")
-
-            return EXISTS_VALID, path_to_validate
+    print(colour="BLUE", prefix="INIT", message=f"File '{config_file_path}' exists. Verifying content...")
+    try:
+        config_data = _load_config(config_file_path)
+    except Exception as e:
+        print(colour="RED", prefix="INIT", message=f"Error reading or parsing '{config_file_path}': {e}")
+        return ERROR_READ, None
+
+    # The config is written at most once, and only if the final path differs from the stored one
+    stored_path = _get_source_path(config_data)
+
+    # --- Check 2: SourcePath key existence and validity ---
+    # A configured path that already validates short-circuits the run, so each path is validated exactly once
+    path_from_config = None # This will hold the path confirmed to be a directory
+    source_path_valid_in_file = False
+    if stored_path and isinstance(stored_path, str) and stored_path.strip():
+        path_from_config = stored_path
+        if is_validation_cached(cache_file_path, path_from_config):
+            print(colour="GREEN", prefix="INIT", message=f"  SourcePath '{path_from_config}' is unchanged since its last successful validation.")
+            return EXISTS_VALID, path_from_config
+        if os.path.isdir(path_from_config):
+            print(colour="CYAN", prefix="INIT", message=f"  Found SourcePath in config: '{path_from_config}'")
+            source_path_valid_in_file, missing_dirs, path_to_validate, validated_mtime_ns = _validate_subdirs(path_from_config)
+            if not source_path_valid_in_file:
+                print(colour="RED", prefix="INIT", message=f"  Error: Validation failed. Could not find all required subdirectories within '{path_to_validate}'.")
+                print(colour="GRAY", prefix="INIT", message=describe_missing_dirs(missing_dirs))
         else:
-            print(colour="RED", prefix="INIT", message=f"\nError: Validation failed. Could not find all required subdirectories from *either* list within '{path_to_validate}'.")
-            print(colour="GRAY", prefix="INIT", message=f"  Checked within path: '{path_to_validate}'.")
-            if path_to_validate != effective_source_path:
-                print(colour="GRAY", prefix="INIT", message=f"  (This path was checked because 'USRDIR' was found inside '{effective_source_path}')")
-            elif effective_source_path != path_from_config:
-                print(colour="GRAY", prefix="INIT", message=f"  (This path resulted from a '{'Copy' if choice == '1' else 'Move'} operation' based on original '{path_from_config}')")
-
-            print(colour="GRAY", prefix="INIT", message=f"  Expected all subdirs from list 'USRDIR_DIRS' OR all from list 'USRDIR_DIRS_ORIGINAL'.")
-            print(colour="RED", prefix="INIT", message=f"  Action Required: Verify the contents of '{path_to_validate}'.")
-            # Return the path that failed validation
-            return EXISTS_INVALID_SUBDIRS, path_to_validate
+            print(colour="YELLOW", prefix="INIT", message=f"  Warning: Configured SourcePath '{path_from_config}' is not currently a valid directory.")
+
+    if source_path_valid_in_file:
+        print(colour="GREEN", prefix="INIT", message=f"\nSuccess: Validation passed. All required subdirectories found within '{path_to_validate}'.")
+        if path_to_validate != stored_path:
+            _save_config(config_file_path, config_data, filename, path_to_validate)
+        store_validation_cache(cache_file_path, path_to_validate, validated_mtime_ns)
+        return EXISTS_VALID, path_to_validate
+
+    # --- Interactive Prompt if SourcePath is Invalid/Missing ---
+    print(colour="YELLOW", prefix="INIT", message=f"Warning: 'RemakeEngine.Directories.SourcePath' in '{filename}' is missing, empty, or invalid.")
+    path_from_config = _prompt_source_path()
+
+    # --- Check 3: User choice for handling the source path ---
+    print(colour="MAGENTA", prefix="INIT", message="\n--- Source Path Handling ---")
+    print(colour="CYAN", prefix="INIT", message=f"Validated source path: '{path_from_config}'")
+    print(colour="CYAN", prefix="INIT", message=f"Local project data path would be: '{local_data_path}'")
+
+    effective_source_path = local_data_path
+    choice = None
+
+    if not os.path.exists(local_data_path):
+        effective_source_path, choice = _choose_source_handling(path_from_config, local_data_path)
+        if effective_source_path is None:
+            return ERROR_FILE_OPERATION, None # Critical error, stop
+
+    # --- Proceed with the 'effective_source_path' ---
+    print(colour="BLUE", prefix="INIT", message=f"\nUsing effective source path for validation: '{effective_source_path}'")
+
+    # --- Check 4/5: USRDIR discovery and subdirectory validation on the *effective* path (original, copied, or moved) ---
+    source_path_valid, missing_dirs, path_to_validate, validated_mtime_ns = _validate_subdirs(effective_source_path)
+
+    # Final validation result
+    if source_path_valid:
+        print(colour="GREEN", prefix="INIT", message=f"\nSuccess: Validation passed. All required subdirectories found within '{path_to_validate}'.")
+        if path_to_validate != stored_path:
+            _save_config(config_file_path, config_data, filename, path_to_validate)
+        store_validation_cache(cache_file_path, path_to_validate, validated_mtime_ns)
+        return EXISTS_VALID, path_to_validate
+    else:
+        _report_validation_failure(path_to_validate, effective_source_path, path_from_config, choice, missing_dirs)
+        # Persist the effective path so the next run re-validates it (and re-prompts if it still fails)
+        if effective_source_path != stored_path:
+            _save_config(config_file_path, config_data, filename, effective_source_path)
+        # Return the path that failed validation
+        return EXISTS_INVALID_SUBDIRS, path_to_validate
 
 
 # --- Main Execution Block (Updated with Colours) ---
 def main():
     config_file_name = "project.json"
-
-    # Call the function to check/create/validate/prompt/operate
-    status, path_value = check_or_create_config(config_file_name)
-
-    print(colour="BLUE", prefix="INIT", message=f"\n--- Final Status: {status} ---")
-    if status == CREATED:
-        print(colour="GREEN", prefix="INIT", message="Configuration file was newly created.")
-        print(colour="RED", prefix="INIT", message="Action Required: Running the script again, provide the 'SourcePath' and choose handling.")
-        main()
-    elif status == EXISTS_VALID:
-        print(colour="GREEN", prefix="INIT", message=f"Configuration is valid. Effective source path '{path_value}' contains required subdirectories.")
+    paths = _config_paths(config_file_name) # Resolved once; unchanged between passes below
+
+    # Call the function to check/create/validate/prompt/operate.
+    # A freshly created config is re-checked straight away (iteratively, not by recursing into main()).
+    while True:
+        status, path_value = check_or_create_config(config_file_name, paths)
+
+        _init_log.log(colour="BLUE", prefix="INIT", message=f"\n--- Final Status: {status} ---")
+        if status != CREATED:
+            break
+        _init_log.log(colour="GREEN", prefix="INIT", message="Configuration file was newly created.")
+        _init_log.log(colour="RED", prefix="INIT", message="Action Required: Running the script again, provide the 'SourcePath' and choose handling.")
+        _init_log.flush()
+
+    if status == EXISTS_VALID:
+        _init_log.log(colour="GREEN", prefix="INIT", message=f"Configuration is valid. Effective source path '{path_value}' contains required subdirectories.")
     elif status == EXISTS_MISSING_SOURCEPATH: # Less likely now
-        print(colour="YELLOW", prefix="INIT", message="Configuration file exists but is missing a valid 'SourcePath'.")
-        print(colour="RED", prefix="INIT", message="Action Required: Run again to provide the path when prompted.")
+        _init_log.log(colour="YELLOW", prefix="INIT", message="Configuration file exists but is missing a valid 'SourcePath'.")
+        _init_log.log(colour="RED", prefix="INIT", message="Action Required: Run again to provide the path when prompted.")
     elif status == EXISTS_INVALID_SUBDIRS:
-        print(colour="RED", prefix="INIT", message=f"Validation failed: Required subdirectories are missing within the path '{path_value}'.")
-        print(colour="RED", prefix="INIT", message="Action Required: Check the contents of this directory.")
+        _init_log.log(colour="RED", prefix="INIT", message=f"Validation failed: Required subdirectories are missing within the path '{path_value}'.")
+        _init_log.log(colour="RED", prefix="INIT", message="Action Required: Check the contents of this directory.")
     elif status == ERROR_INVALID_SOURCEPATH_DIR:
-        print(colour="RED", prefix="INIT", message=f"Configuration file exists, but the configured/provided SourcePath ('{path_value}') is not a directory.")
-        print(colour="RED", prefix="INIT", message="Action Required: Correct the 'SourcePath' or provide a valid path when prompted.")
+        _init_log.log(colour="RED", prefix="INIT", message=f"Configuration file exists, but the configured/provided SourcePath ('{path_value}') is not a directory.")
+        _init_log.log(colour="RED", prefix="INIT", message="Action Required: Correct the 'SourcePath' or provide a valid path when prompted.")
     elif status == USER_PROVIDED_PATH_INVALID:
-        print(colour="RED", prefix="INIT", message="Failed to obtain a valid source directory path from user input.")
-        print(colour="RED", prefix="INIT", message="Action Required: Run the script again and provide a valid directory path.")
+        _init_log.log(colour="RED", prefix="INIT", message="Failed to obtain a valid source directory path from user input.")
+        _init_log.log(colour="RED", prefix="INIT", message="Action Required: Run the script again and provide a valid directory path.")
     elif status == ERROR_FILE_OPERATION:
-        print(colour="RED", prefix="INIT", message=f"A critical error occurred during file Copy/Move operations.")
-        print(colour="RED", prefix="INIT", message="Action Required: Check disk space, permissions, and previous error messages. The source/destination state may be inconsistent.")
+        _init_log.log(colour="RED", prefix="INIT", message=f"A critical error occurred during file Copy/Move operations.")
+        _init_log.log(colour="RED", prefix="INIT", message="Action Required: Check disk space, permissions, and previous error messages. The source/destination state may be inconsistent.")
     elif status == ERROR_CREATE or status == ERROR_READ:
-        print(colour="RED", prefix="INIT", message="An error occurred during config file creation or reading.")
-        print(colour="RED", prefix="INIT", message="Action Required: Check file permissions or disk space.")
+        _init_log.log(colour="RED", prefix="INIT", message="An error occurred during config file creation or reading.")
+        _init_log.log(colour="RED", prefix="INIT", message="Action Required: Check file permissions or disk space.")
     else:
-        print(colour="MAGENTA", prefix="INIT", message="An unexpected status was returned.")
+        _init_log.log(colour="MAGENTA", prefix="INIT", message="An unexpected status was returned.")
 
     # Example use of path_value
     if status == EXISTS_VALID and path_value:
-        print(colour="GREEN", prefix="INIT", message=f"\nProceeding with operations using validated source directory: {path_value}")
+        _init_log.log(colour="GREEN", prefix="INIT", message=f"\nProceeding with operations using validated source directory: {path_value}")
         # Add application logic here...
         pass
-    elif status not in [CREATED]: # Don't print 'Cannot proceed' if just created
-        print(colour="RED", prefix="INIT", message="\nCannot proceed due to configuration or file operation issues.")
+    else:
+        _init_log.log(colour="RED", prefix="INIT", message="\nCannot proceed due to configuration or file operation issues.")
+    _init_log.flush()
 
     return status, path_value
 
@@ -0,0 +1,99 @@
+"""
+Tests for the file operations in Scripts/init.py.
+"""
+import builtins
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'Scripts'))
+try:
+    import init
+except ImportError:
+    # Engine.Utils.printer lives in the RemakeEngine checkout, not in this repository
+    printer = types.ModuleType("Engine.Utils.printer")
+    printer.print = lambda colour="", prefix="", message="": builtins.print(f"[{prefix}] {message}")
+    printer.Colours = types.SimpleNamespace(YELLOW="", RESET="")
+    sys.modules.setdefault("Engine", types.ModuleType("Engine"))
+    sys.modules.setdefault("Engine.Utils", types.ModuleType("Engine.Utils"))
+    sys.modules["Engine.Utils.printer"] = printer
+    import init
+
+
+class MoveDirectoryCrossDeviceTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        root = self.tmp.name
+        self.src = os.path.join(root, "src")
+        self.dst = os.path.join(root, "dst", "SimpGamePS2")
+        self.outside = os.path.join(root, "outside")
+
+        os.makedirs(os.path.join(self.src, "USRDIR", "ENVS", "empty"))
+        with open(os.path.join(self.src, "USRDIR", "ENVS", "level.bin"), "wb") as f:
+            f.write(b"level")
+        os.makedirs(self.outside)
+        with open(os.path.join(self.outside, "shared.bin"), "wb") as f:
+            f.write(b"shared")
+        os.symlink(self.outside, os.path.join(self.src, "USRDIR", "linked"))
+
+    def _stat_other_device(self, real_stat):
+        """os.stat replacement reporting a different st_dev for dst's parent, forcing the copy path."""
+        dst_parent = os.path.dirname(self.dst)
+        def fake_stat(path, *args, **kwargs):
+            st = real_stat(path, *args, **kwargs)
+            if os.fspath(path) == dst_parent:
+                fields = list(st)
+                fields[2] = st.st_dev + 1 # st_dev
+                return os.stat_result(fields)
+            return st
+        return fake_stat
+
+    def test_moves_tree_with_symlink_and_empty_dir(self):
+        with mock.patch.object(init.os, "stat", self._stat_other_device(os.stat)), \
+                mock.patch.object(init.os, "rename", side_effect=AssertionError("rename used across devices")):
+            init.move_directory(self.src, self.dst)
+
+        self.assertFalse(os.path.lexists(self.src))
+        usrdir = os.path.join(self.dst, "USRDIR")
+        with open(os.path.join(usrdir, "ENVS", "level.bin"), "rb") as f:
+            self.assertEqual(f.read(), b"level")
+        self.assertTrue(os.path.isdir(os.path.join(usrdir, "ENVS", "empty")))
+        self.assertEqual(os.listdir(os.path.join(usrdir, "ENVS", "empty")), [])
+        linked = os.path.join(usrdir, "linked")
+        self.assertTrue(os.path.islink(linked))
+        self.assertEqual(os.readlink(linked), self.outside)
+        # The link target outside the moved tree is left alone
+        self.assertEqual(os.listdir(self.outside), ["shared.bin"])
+
+    def test_special_file_fails_with_source_intact(self):
+        if not hasattr(os, "mkfifo"):
+            self.skipTest("os.mkfifo is not available")
+        os.mkfifo(os.path.join(self.src, "USRDIR", "ENVS", "pipe"))
+        with mock.patch.object(init.os, "stat", self._stat_other_device(os.stat)):
+            with self.assertRaises(shutil.SpecialFileError):
+                init.move_directory(self.src, self.dst)
+
+        self.assertEqual(sorted(os.listdir(os.path.join(self.src, "USRDIR", "ENVS"))), ["empty", "level.bin", "pipe"])
+        self.assertTrue(os.path.islink(os.path.join(self.src, "USRDIR", "linked")))
+        self.assertFalse(os.path.lexists(self.dst))
+
+    def test_symlinked_source_moves_the_link(self):
+        link = os.path.join(self.tmp.name, "src_link")
+        os.symlink(self.src, link)
+        with mock.patch.object(init.os, "stat", self._stat_other_device(os.stat)):
+            init.move_directory(link, self.dst)
+
+        self.assertFalse(os.path.lexists(link))
+        self.assertTrue(os.path.islink(self.dst))
+        self.assertEqual(os.readlink(self.dst), self.src)
+        # The link target keeps all of its files
+        self.assertTrue(os.path.isfile(os.path.join(self.src, "USRDIR", "ENVS", "level.bin")))
+
+
+if __name__ == "__main__":
+    unittest.main()